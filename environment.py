@@ -0,0 +1,324 @@
+import os
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+import numpy as np
+import pygame
+import settings
+from sprites import PlayerCar, ObstacleCar, Obstacle
+from timer import Timer
+
+
+timer = Timer()
+
+# Action bit flags, one per arrow key. Combine them with `|` to press several keys at once.
+ACTION_NONE = 0
+ACTION_UP = 1
+ACTION_DOWN = 2
+ACTION_LEFT = 4
+ACTION_RIGHT = 8
+
+# Entity kinds used in observations. EMPTY marks padding slots and collected bonuses.
+EMPTY = 0
+PLAYER_CAR = 1
+OBSTACLE_CAR = 2
+OBSTACLE = 3
+BONUS = 4
+
+ENTITY_KINDS = {
+    'player_car': PLAYER_CAR,
+    'obstacle_car': OBSTACLE_CAR,
+    'obstacle': OBSTACLE,
+    'bonus': BONUS,
+}
+
+OBSERVATION_MODES = ('positions', 'frame')
+
+
+class VectorEnvironment:
+    """
+    Headless environment that steps several independent game worlds in lockstep.
+
+    Each world is built from a level file and follows the same rules as the `PlayerCar`, `ObstacleCar`,
+    `Obstacle` and `Bonus` sprites, but the whole batch is stored in numpy arrays of shape
+    (num_worlds, max_entities), so no display, surfaces or sprite objects are needed.
+    """
+
+    BONUS_REWARD = 1.0
+    LIFE_LOST_REWARD = -1.0
+
+    def __init__(self, num_worlds: int, level_index: Union[int, Sequence[int]] = 1,
+                 observation: str = 'positions', frame_scale: int = 8, seed: Optional[int] = None):
+        """
+        Initialize a VectorEnvironment object.
+
+        Args:
+            num_worlds (int): The number of worlds to step in lockstep.
+            level_index (Union[int, Sequence[int]], optional): The 1-based level number for all worlds,
+                or one level number per world. Default is 1.
+            observation (str, optional): Either 'positions' for entity positions or 'frame' for
+                a downsampled frame. Default is 'positions'.
+            frame_scale (int, optional): Downsampling factor of the 'frame' observation. Default is 8.
+            seed (Optional[int], optional): Seed of the random number generator. Default is None.
+        """
+        if num_worlds < 1:
+            raise ValueError(f'Number of worlds must be at least 1, got {num_worlds}')
+        if observation not in OBSERVATION_MODES:
+            raise ValueError(f'Unknown observation mode: {observation}')
+        level_files = self._get_level_files()
+        level_indices = np.broadcast_to(np.asarray(level_index, dtype=np.int32), (num_worlds,)).copy()
+        if level_indices.min() < 1 or level_indices.max() > len(level_files):
+            raise ValueError(f'Level index must be between 1 and {len(level_files)}')
+
+        self.num_worlds = num_worlds
+        self.level_indices = level_indices
+        self.observation = observation
+        self.frame_scale = frame_scale
+        self.rng = np.random.default_rng(seed)
+
+        levels = {index: self._load_level(level_files[index - 1]) for index in set(level_indices.tolist())}
+        self.max_entities = max(len(entities) for _, entities in levels.values())
+        self._build_templates(levels)
+        self._allocate_state()
+        self.reset()
+
+    @staticmethod
+    def _get_level_files() -> List[str]:
+        """Return a sorted list of level file paths."""
+        path = 'data/levels'
+        return [f'{path}/{file_name}' for file_name in sorted(os.listdir(path))]
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _get_image_size(image_path: str) -> Tuple[int, int]:
+        """Return the (width, height) of the given image, which is the size of the sprite's rect."""
+        return pygame.image.load(image_path).get_size()
+
+    @classmethod
+    def _load_level(cls, level_file: str) -> Tuple[tuple, List[tuple]]:
+        """
+        Load the level from the given file.
+
+        Returns:
+            Tuple[tuple, List[tuple]]: The player's (left, top, width, height) and a list of
+                (kind, left, top, width, height) tuples for the other entities.
+        """
+        player = None
+        entities = []
+        with open(level_file, 'r') as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    entity, x, y, image_path = line.split()
+                    width, height = cls._get_image_size(image_path)
+                    # Same placement as `image.get_rect(center=(x, y))`
+                    left, top = int(x) - width // 2, int(y) - height // 2
+                    if entity == 'player_car':
+                        player = (left, top, width, height)
+                    elif entity in ENTITY_KINDS:
+                        entities.append((ENTITY_KINDS[entity], left, top, width, height))
+        if player is None:
+            raise ValueError(f'Level file has no player car: {level_file}')
+        return player, entities
+
+    def _build_templates(self, levels: Dict[int, Tuple[tuple, List[tuple]]]) -> None:
+        """Build the per-world initial state arrays from the loaded levels."""
+        shape = (self.num_worlds, self.max_entities)
+        self.player_start = np.zeros((self.num_worlds, 4), dtype=np.int32)
+        self.start_kind = np.zeros(shape, dtype=np.int8)
+        self.start_x = np.zeros(shape, dtype=np.int32)
+        self.start_y = np.zeros(shape, dtype=np.int32)
+        self.width = np.zeros(shape, dtype=np.int32)
+        self.height = np.zeros(shape, dtype=np.int32)
+        for world, index in enumerate(self.level_indices.tolist()):
+            player, entities = levels[index]
+            self.player_start[world] = player
+            if entities:
+                kind, left, top, width, height = (np.asarray(column) for column in zip(*entities))
+                count = len(entities)
+                self.start_kind[world, :count] = kind
+                self.start_x[world, :count] = left
+                self.start_y[world, :count] = top
+                self.width[world, :count] = width
+                self.height[world, :count] = height
+        self.player_width = self.player_start[:, 2].copy()
+        self.player_height = self.player_start[:, 3].copy()
+
+    def _allocate_state(self) -> None:
+        """Allocate the arrays holding the mutable state of all worlds."""
+        shape = (self.num_worlds, self.max_entities)
+        self.player_x = np.zeros(self.num_worlds, dtype=np.int32)
+        self.player_y = np.zeros(self.num_worlds, dtype=np.int32)
+        self.lives = np.zeros(self.num_worlds, dtype=np.int32)
+        self.invincible_time = np.zeros(self.num_worlds, dtype=np.int32)
+        self.level_timer = np.zeros(self.num_worlds, dtype=np.int32)
+        self.kind = np.zeros(shape, dtype=np.int8)
+        self.x = np.zeros(shape, dtype=np.int32)
+        self.y = np.zeros(shape, dtype=np.int32)
+        self.speed = np.zeros(shape, dtype=np.int32)
+
+    def _reset_worlds(self, mask: np.ndarray) -> None:
+        """Reset the worlds selected by the boolean mask to the start of their level."""
+        self.player_x[mask] = self.player_start[mask, 0]
+        self.player_y[mask] = self.player_start[mask, 1]
+        self.lives[mask] = settings.PLAYER_CAR_LIVES
+        self.invincible_time[mask] = 0
+        self.level_timer[mask] = timer.seconds_to_frames(seconds=settings.LEVEL_TIME)
+        kind = self.start_kind[mask]
+        self.kind[mask] = kind
+        self.x[mask] = self.start_x[mask]
+        self.y[mask] = self.start_y[mask]
+        # Obstacle cars and obstacles get a random speed, bonuses always move at the same speed
+        low, high = settings.OBSTACLE_SPEED_RANGE
+        speed = self.rng.integers(low, high + 1, size=kind.shape)
+        self.speed[mask] = np.where(kind == BONUS, settings.BONUS_SPEED, speed)
+
+    def _player_overlap(self) -> np.ndarray:
+        """Return a (num_worlds, max_entities) mask of entities colliding with the player's car."""
+        player_x, player_y = self.player_x[:, None], self.player_y[:, None]
+        return (
+            (self.kind != EMPTY)
+            & (self.x < player_x + self.player_width[:, None])
+            & (player_x < self.x + self.width)
+            & (self.y < player_y + self.player_height[:, None])
+            & (player_y < self.y + self.height)
+        )
+
+    def _move_player(self, actions: np.ndarray) -> None:
+        """Move the player's cars according to the actions, keeping them within the screen."""
+        up = ((actions & ACTION_UP) != 0) & (self.player_y > 0)
+        self.player_y -= settings.PLAYER_CAR_SPEED * up
+        down = ((actions & ACTION_DOWN) != 0) & (self.player_y + self.player_height < settings.SCREEN_HEIGHT)
+        self.player_y += settings.PLAYER_CAR_SPEED * down
+        left = ((actions & ACTION_LEFT) != 0) & (self.player_x > 0)
+        self.player_x -= settings.PLAYER_CAR_SPEED * left
+        right = ((actions & ACTION_RIGHT) != 0) & (self.player_x + self.player_width < settings.SCREEN_WIDTH)
+        self.player_x += settings.PLAYER_CAR_SPEED * right
+
+    def _update_entities(self) -> None:
+        """Move the entities down the road and respawn the ones that left the screen."""
+        self.y += self.speed
+        rows, cols = np.nonzero((self.kind != EMPTY) & (self.y > settings.SCREEN_HEIGHT))
+        if rows.size:
+            kind = self.kind[rows, cols]
+            width = self.width[rows, cols]
+            height = self.height[rows, cols]
+            # Respawn ranges of `ObstacleCar.reset_position`, `Obstacle.update` and `Bonus.update`
+            obstacle_low, obstacle_high = Obstacle.RESPAWN_Y_RANGE
+            is_car, is_obstacle = kind == OBSTACLE_CAR, kind == OBSTACLE
+            low = np.select([is_car, is_obstacle], [-height, obstacle_low], -height)
+            high = np.select([is_car, is_obstacle], [ObstacleCar.RESPAWN_MAX_Y, obstacle_high], -height)
+            self.x[rows, cols] = self.rng.integers(0, settings.SCREEN_WIDTH - width + 1)
+            self.y[rows, cols] = self.rng.integers(low, high + 1)
+
+    def reset(self, seed: Optional[int] = None) -> np.ndarray:
+        """
+        Reset all worlds to the start of their level.
+
+        Args:
+            seed (Optional[int], optional): New seed of the random number generator. Default is None.
+
+        Returns:
+            np.ndarray: The batched observation.
+        """
+        if seed is not None:
+            self.rng = np.random.default_rng(seed)
+        self._reset_worlds(np.ones(self.num_worlds, dtype=bool))
+        return self._observe()
+
+    def step(self, actions: Sequence[int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Advance all worlds by one frame.
+
+        Worlds that are done are reset automatically, so the returned observation of such a world
+        is the first observation of its next episode.
+
+        Args:
+            actions (Sequence[int]): One combination of the ACTION_* flags per world.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray, Dict[str, np.ndarray]]: The batched observation,
+                rewards, done flags and an info dictionary with the 'lives' and 'level_completed'
+                arrays of the frame, before any automatic reset.
+        """
+        actions = np.asarray(actions)
+        if actions.shape != (self.num_worlds,):
+            raise ValueError(f'Expected {self.num_worlds} actions, got shape {actions.shape}')
+
+        self._move_player(actions)
+
+        # Collisions: every hazard hit at once costs a life, unless the player's car is invincible
+        hazards = ((self.kind == OBSTACLE_CAR) | (self.kind == OBSTACLE)) & self._player_overlap()
+        hits = np.where(self.invincible_time > 0, 0, hazards.sum(axis=1))
+        self.lives -= hits
+        self.invincible_time[hits > 0] = PlayerCar.INVINCIBILITY_DURATION
+        game_over = self.lives <= 0
+        rewards = self.LIFE_LOST_REWARD * hits
+
+        self.level_timer -= 1
+        self.invincible_time -= self.invincible_time > 0
+        self._update_entities()
+
+        # Bonus collection: each bonus restores a life, up to the total number of lives.
+        # Like `Game.run`, a world whose player just lost the last life collects nothing.
+        collected = (self.kind == BONUS) & self._player_overlap() & ~game_over[:, None]
+        bonuses = collected.sum(axis=1)
+        self.kind[collected] = EMPTY
+        total_lives = settings.PLAYER_CAR_LIVES
+        self.lives = np.where(self.lives < total_lives, np.minimum(self.lives + bonuses, total_lives), self.lives)
+        rewards += self.BONUS_REWARD * bonuses
+
+        level_completed = (self.level_timer <= 0) & ~game_over
+        dones = game_over | level_completed
+        info = {'lives': self.lives.copy(), 'level_completed': level_completed}
+        if dones.any():
+            self._reset_worlds(dones)
+        return self._observe(), rewards, dones, info
+
+    def _observe(self) -> np.ndarray:
+        """Return the batched observation in the configured mode."""
+        if self.observation == 'frame':
+            return self._render_frames()
+        return self._entity_positions()
+
+    def _entity_positions(self) -> np.ndarray:
+        """
+        Return the entity positions of all worlds.
+
+        Returns:
+            np.ndarray: An int32 array of shape (num_worlds, 1 + max_entities, 3) holding the
+                (kind, center x, center y) of the player's car followed by the other entities.
+        """
+        observation = np.empty((self.num_worlds, 1 + self.max_entities, 3), dtype=np.int32)
+        observation[:, 0, 0] = PLAYER_CAR
+        observation[:, 0, 1] = self.player_x + self.player_width // 2
+        observation[:, 0, 2] = self.player_y + self.player_height // 2
+        observation[:, 1:, 0] = self.kind
+        observation[:, 1:, 1] = self.x + self.width // 2
+        observation[:, 1:, 2] = self.y + self.height // 2
+        return observation
+
+    def _render_frames(self) -> np.ndarray:
+        """
+        Render a downsampled frame of every world, without a display.
+
+        Returns:
+            np.ndarray: A uint8 array of shape (num_worlds, SCREEN_HEIGHT // frame_scale,
+                SCREEN_WIDTH // frame_scale) where each pixel holds the kind of the entity covering it.
+        """
+        scale = self.frame_scale
+        rows = np.arange(settings.SCREEN_HEIGHT // scale)[None, :, None]
+        cols = np.arange(settings.SCREEN_WIDTH // scale)[None, None, :]
+        frames = np.zeros((self.num_worlds, rows.shape[1], cols.shape[2]), dtype=np.uint8)
+        slots = [(self.kind[:, i], self.x[:, i], self.y[:, i], self.width[:, i], self.height[:, i])
+                 for i in range(self.max_entities)]
+        slots.append((np.full(self.num_worlds, PLAYER_CAR), self.player_x, self.player_y,
+                      self.player_width, self.player_height))
+        for kind, x, y, width, height in slots:
+            # Ceil the far edges so that entities smaller than a pixel stay visible
+            covered = (
+                (kind != EMPTY)[:, None, None]
+                & (rows >= (y // scale)[:, None, None]) & (rows < (-(-(y + height) // scale))[:, None, None])
+                & (cols >= (x // scale)[:, None, None]) & (cols < (-(-(x + width) // scale))[:, None, None])
+            )
+            frames = np.where(covered, kind[:, None, None].astype(np.uint8), frames)
+        return frames
@@ -1,5 +1,7 @@
 import pygame
+import settings
 import utils
+from rewind import RewindBuffer
 from screens import LevelScreen, GameOverScreen
 from timer import Timer
 
@@ -13,6 +15,7 @@ class Game:
         self.level_screen = LevelScreen()
         self.game_over_screen = GameOverScreen()
         self.timer = Timer()
+        self.rewind_buffer = RewindBuffer(seconds=settings.REWIND_TIME)
         self.running = True
 
     def run(self) -> None:
@@ -22,22 +25,31 @@ class Game:
         while self.running:
             # Load current level
             self.level_screen.load_current_level()
+            self.rewind_buffer.clear()
 
             while self.level_screen.level_timer > 0:
                 # Handle quit event
                 utils.handle_quit_event()
 
-                # Handle player car input
-                self.level_screen.player_car.handle_input()
+                # Rewind the level by one frame while the rewind key is held
+                if pygame.key.get_pressed()[pygame.K_r] and self.rewind_buffer:
+                    self.level_screen.restore(self.rewind_buffer.rewind())
+                else:
+                    # Handle player car input
+                    self.level_screen.player_car.handle_input()
 
-                # Handle collisions
-                self.level_screen.handle_collision()
+                    # Handle collisions
+                    self.level_screen.handle_collision()
 
-                if self.level_screen.player_car.current_lives <= 0:
-                    self.game_over_screen.display()
-                    self.game_over_screen.handle_events()
+                    if self.level_screen.player_car.current_lives <= 0:
+                        self.game_over_screen.display()
+                        self.game_over_screen.handle_events()
+                        # A new game has started, so the lost game can no longer be rewound
+                        self.rewind_buffer.clear()
+
+                    self.level_screen.update_level()
+                    self.rewind_buffer.push(self.level_screen.snapshot())
 
-                self.level_screen.update_level()
                 self.level_screen.draw_level()
 
                 pygame.display.flip()
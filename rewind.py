@@ -0,0 +1,90 @@
+from timer import Timer
+
+
+timer = Timer()
+
+
+class RewindBuffer:
+    """
+    Ring buffer keeping the level snapshots of the last seconds of play.
+
+    Snapshots of a level all have the same size, so the buffer is a single preallocated bytearray
+    of `capacity` records and its memory use never grows while playing.
+    """
+
+    def __init__(self, seconds: float):
+        """
+        Initialize a RewindBuffer object.
+
+        Args:
+            seconds (float): How many seconds of snapshots to keep, at one snapshot per frame.
+        """
+        self.capacity = max(timer.seconds_to_frames(seconds=seconds), 1)
+        self.record_size = 0
+        self.buffer = bytearray()
+        self.start = 0
+        self.count = 0
+
+    def __len__(self) -> int:
+        """Return the number of stored snapshots."""
+        return self.count
+
+    @property
+    def nbytes(self) -> int:
+        """Return the memory allocated for the stored snapshots, in bytes."""
+        return len(self.buffer)
+
+    def clear(self) -> None:
+        """Remove all stored snapshots."""
+        self.start = 0
+        self.count = 0
+
+    def push(self, snapshot: bytes) -> None:
+        """
+        Store a snapshot, overwriting the oldest one when the buffer is full.
+
+        A snapshot of a different size than the stored ones (e.g. from another level) clears the buffer.
+
+        Args:
+            snapshot (bytes): The snapshot record returned by `LevelScreen.snapshot`.
+        """
+        if len(snapshot) != self.record_size:
+            self.record_size = len(snapshot)
+            self.buffer = bytearray(self.capacity * self.record_size)
+            self.clear()
+        index = (self.start + self.count) % self.capacity
+        self.buffer[index * self.record_size:(index + 1) * self.record_size] = snapshot
+        if self.count < self.capacity:
+            self.count += 1
+        else:
+            self.start = (self.start + 1) % self.capacity
+
+    def get(self, frames_ago: int = 0) -> bytes:
+        """
+        Return a stored snapshot without removing it, e.g. to branch a simulation from it.
+
+        Args:
+            frames_ago (int, optional): How many frames before the newest snapshot. Default is 0 (the newest).
+
+        Returns:
+            bytes: The snapshot record.
+        """
+        if not 0 <= frames_ago < self.count:
+            raise IndexError(f'No snapshot {frames_ago} frames ago, {self.count} stored')
+        index = (self.start + self.count - 1 - frames_ago) % self.capacity
+        return bytes(self.buffer[index * self.record_size:(index + 1) * self.record_size])
+
+    def rewind(self, frames: int = 1) -> bytes:
+        """
+        Drop the newest snapshots and return the one that becomes the newest.
+
+        Args:
+            frames (int, optional): How many frames to go back, limited to the oldest snapshot. Default is 1.
+
+        Returns:
+            bytes: The snapshot record to restore.
+        """
+        if not self.count:
+            raise IndexError('No snapshot to rewind to')
+        self.count -= min(frames, self.count - 1)
+        return self.get()
@@ -1,5 +1,7 @@
 import os
 import random
+import struct
+from array import array
 import pygame
 import settings
 import utils
@@ -48,6 +50,10 @@ class BaseScreen(Screen):
 class LevelScreen(BaseScreen):
     """Class representing the level screen."""
 
+    # Snapshot layout: header, RNG state, int16 x, y and speed columns and one alive byte per level entity
+    SNAPSHOT_HEADER = struct.Struct('<HHibb?hhB')
+    SNAPSHOT_RNG_STATE = struct.Struct('<B625I?d')
+
     def __init__(self):
         """Initialize a LevelScreen object."""
         super().__init__()
@@ -58,8 +64,9 @@ class LevelScreen(BaseScreen):
         self.level_files = self._get_level_files()
         self.current_level_index = 1
         self.level_sprites = None
+        self.level_entities = []
         self.win_screen = WinScreen()
-        self.level_time = 15
+        self.level_time = settings.LEVEL_TIME
         self.level_timer = 0
         self.sound.play_sound(sound_name='background', loops=-1)
 
@@ -87,9 +94,9 @@ class LevelScreen(BaseScreen):
                     entity, x, y, image_path = line.split()
                     x, y = int(x), int(y)
                     if entity == 'player_car':
-                        level_sprites.add(PlayerCar(x, y, 5, image_path))
+                        level_sprites.add(PlayerCar(x, y, settings.PLAYER_CAR_SPEED, image_path))
                     elif entity == 'obstacle_car':
-                        level_sprites.add(ObstacleCar(x, y, random.randint(3, 7), image_path))
+                        level_sprites.add(ObstacleCar(x, y, random.randint(*settings.OBSTACLE_SPEED_RANGE), image_path))
                     elif entity == 'obstacle':
                         level_sprites.add(Obstacle(x, y, image_path))
                     elif entity == 'bonus':
@@ -152,6 +159,7 @@ class LevelScreen(BaseScreen):
         """Load the current level."""
         current_player_lives = self.player_car.current_lives if self.level_sprites else None
         self.level_sprites = self._load_level(self.level_files[self.current_level_index - 1])
+        self.level_entities = self.level_sprites.sprites()
         self.level_timer = timer.seconds_to_frames(seconds=self.level_time)
         self.player_car.current_lives = current_player_lives or self.player_car.current_lives
         self.display_current_level_number()
@@ -177,7 +185,7 @@ class LevelScreen(BaseScreen):
             if isinstance(sprite, Bonus) and pygame.sprite.collide_rect(self.player_car, sprite):
                 self.sound.play_sound(sound_name='bonus')
                 self.level_sprites.remove(sprite)
-                if self.player_car.current_lives < 3:
+                if self.player_car.current_lives < self.player_car.total_lives:
                     self.player_car.current_lives += 1
 
     def update_level(self) -> None:
@@ -193,6 +201,94 @@ class LevelScreen(BaseScreen):
         self.draw_timer()
         self.display_player_lives()
 
+    def snapshot(self) -> bytes:
+        """
+        Capture the current level state as a compact binary record.
+
+        The record holds the level timer, the player's car state, the RNG state and the position
+        and speed of every entity loaded from the level file, so its size only depends on the level.
+
+        Returns:
+            bytes: The snapshot record.
+        """
+        player_car = self.player_car
+        alpha = player_car.image.get_alpha()
+        header = self.SNAPSHOT_HEADER.pack(
+            self.current_level_index,
+            len(self.level_entities),
+            self.level_timer,
+            player_car.current_lives,
+            player_car.total_lives,
+            player_car.invincible,
+            player_car.invincible_time,
+            player_car.blink_timer,
+            255 if alpha is None else alpha
+        )
+        version, internal_state, gauss_next = random.getstate()
+        rng_state = self.SNAPSHOT_RNG_STATE.pack(
+            version, *internal_state, gauss_next is not None, gauss_next or 0.0
+        )
+        positions = array('h', [sprite.rect.x for sprite in self.level_entities])
+        positions.extend([sprite.rect.y for sprite in self.level_entities])
+        positions.extend([sprite.speed for sprite in self.level_entities])
+        level_sprites = self.level_sprites.spritedict
+        alive = bytes([sprite in level_sprites for sprite in self.level_entities])
+        return header + rng_state + positions.tobytes() + alive
+
+    def restore(self, snapshot: bytes) -> None:
+        """
+        Restore the level state from a record returned by `snapshot`.
+
+        Args:
+            snapshot (bytes): The snapshot record.
+        """
+        (
+            level_index, entity_count, level_timer, current_lives, total_lives,
+            invincible, invincible_time, blink_timer, alpha
+        ) = self.SNAPSHOT_HEADER.unpack_from(snapshot)
+        entity_size = 3 * array('h').itemsize + 1
+        expected_size = self.SNAPSHOT_HEADER.size + self.SNAPSHOT_RNG_STATE.size + entity_count * entity_size
+        if len(snapshot) != expected_size:
+            raise ValueError(f'Snapshot has {len(snapshot)} bytes, expected {expected_size}')
+
+        # Validate the record against its level before changing any state
+        level_sprites, level_entities = self.level_sprites, self.level_entities
+        if level_index != self.current_level_index or level_sprites is None:
+            level_sprites = self._load_level(self.level_files[level_index - 1])
+            level_entities = level_sprites.sprites()
+        if entity_count != len(level_entities):
+            raise ValueError(f'Snapshot has {entity_count} entities, level {level_index} has {len(level_entities)}')
+        self.current_level_index = level_index
+        self.level_sprites, self.level_entities = level_sprites, level_entities
+
+        offset = self.SNAPSHOT_HEADER.size
+        version, *internal_state, has_gauss_next, gauss_next = self.SNAPSHOT_RNG_STATE.unpack_from(snapshot, offset)
+        random.setstate((version, tuple(internal_state), gauss_next if has_gauss_next else None))
+
+        offset += self.SNAPSHOT_RNG_STATE.size
+        positions = array('h')
+        positions.frombytes(snapshot[offset:offset + entity_count * 3 * positions.itemsize])
+        alive = snapshot[offset + len(positions) * positions.itemsize:]
+        xs, ys, speeds = (positions[i * entity_count:(i + 1) * entity_count] for i in range(3))
+        alive_changed = False
+        for sprite, x, y, speed, is_alive in zip(level_entities, xs, ys, speeds, alive):
+            sprite.rect.topleft = x, y
+            sprite.speed = speed
+            alive_changed = alive_changed or is_alive != (sprite in level_sprites.spritedict)
+        # Rebuild the group in level file order, which is the update and draw order of a fresh level
+        if alive_changed:
+            level_sprites.empty()
+            level_sprites.add(*[sprite for sprite, is_alive in zip(level_entities, alive) if is_alive])
+
+        self.level_timer = level_timer
+        player_car = self.player_car
+        player_car.current_lives = current_lives
+        player_car.total_lives = total_lives
+        player_car.invincible = invincible
+        player_car.invincible_time = invincible_time
+        player_car.blink_timer = blink_timer
+        player_car.image.set_alpha(alpha)
+
     def next_level(self) -> bool:
         """Move to the next level. Return False if there are no more levels."""
         self.current_level_index += 1
@@ -16,5 +16,15 @@ FONT_LARGE = (None, 74)
 FONT_SMALL = (None, 36)
 
 # Timing settings
+LEVEL_TIME = 15
 LEVEL_TEXT_DISPLAY_TIME = 2000
 COLLISION_DISPLAY_TIME = 1000
+
+# Sprite settings
+PLAYER_CAR_SPEED = 5
+PLAYER_CAR_LIVES = 3
+OBSTACLE_SPEED_RANGE = (3, 7)
+BONUS_SPEED = 1
+
+# Rewind settings
+REWIND_TIME = 5
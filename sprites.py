@@ -1,6 +1,6 @@
 import pygame
 import random
-from settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, PLAYER_CAR_LIVES, OBSTACLE_SPEED_RANGE, BONUS_SPEED
 from pygame.locals import *
 from timer import Timer
 
@@ -48,7 +48,7 @@ class PlayerCar(Car):
             image_path (str): Path to the image file for the player's car.
         """
         super().__init__(x, y, speed, image_path)
-        self.total_lives = 3
+        self.total_lives = PLAYER_CAR_LIVES
         self.current_lives = self.total_lives
         self.invincible = False
         self.invincible_time = 0
@@ -97,6 +97,8 @@ class PlayerCar(Car):
 class ObstacleCar(Car):
     """Class representing an obstacle car on the road."""
 
+    RESPAWN_MAX_Y = -100  # Respawn between its own height and this distance above the screen
+
     def __init__(self, x: int, y: int, speed: int, image_path: str):
         """
         Initialize an ObstacleCar object.
@@ -112,7 +114,7 @@ class ObstacleCar(Car):
     def reset_position(self) -> None:
         """Reset the obstacle car's position to a new random location."""
         self.rect.x = random.randint(0, SCREEN_WIDTH - self.rect.width)
-        self.rect.y = random.randint(-self.rect.height, -100)
+        self.rect.y = random.randint(-self.rect.height, self.RESPAWN_MAX_Y)
 
     def update(self) -> None:
         """Update the obstacle car's position and reset if it moves off-screen."""
@@ -124,6 +126,8 @@ class ObstacleCar(Car):
 class Obstacle(pygame.sprite.Sprite):
     """Class representing an obstacle on the road."""
 
+    RESPAWN_Y_RANGE = (-100, -50)
+
     def __init__(self, x: int, y: int, image_path: str):
         """
         Initialize an Obstacle object.
@@ -136,13 +140,13 @@ class Obstacle(pygame.sprite.Sprite):
         super().__init__()
         self.image = pygame.image.load(image_path).convert_alpha()
         self.rect = self.image.get_rect(center=(x, y))
-        self.speed = random.randint(3, 7)
+        self.speed = random.randint(*OBSTACLE_SPEED_RANGE)
 
     def update(self) -> None:
         """Update the obstacle's position."""
         self.rect.y += self.speed
         if self.rect.top > SCREEN_HEIGHT:
-            self.rect.y = random.randint(-100, -50)
+            self.rect.y = random.randint(*self.RESPAWN_Y_RANGE)
             self.rect.x = random.randint(0, SCREEN_WIDTH - self.rect.width)
 
 
@@ -161,7 +165,7 @@ class Bonus(pygame.sprite.Sprite):
         super().__init__()
         self.image = pygame.image.load(image_path).convert_alpha()
         self.rect = self.image.get_rect(center=(x, y))
-        self.speed = 1
+        self.speed = BONUS_SPEED
 
     def update(self) -> None:
         """Update the bonus item's position."""